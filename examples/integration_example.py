@@ -6,9 +6,74 @@ This example shows how to integrate Universe MCP data
 into your own application or tool.
 """
 
+import bisect
+import functools
+import hashlib
+import heapq
 import json
+import os
+import pickle
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+# Where parsed index snapshots are reused while the source JSON is unchanged.
+# Caching is opt-in: set UNIVERSE_MCP_CACHE_DIR or pass cache_dir explicitly
+CACHE_DIR = os.environ.get('UNIVERSE_MCP_CACHE_DIR') or None
+
+# Number of distinct queries remembered by search() and recommend_servers()
+QUERY_CACHE_SIZE = 256
+
+
+def load_json(path: Path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_json_cached(path: Path, cache_dir: Optional[Path] = CACHE_DIR):
+    """
+    Parse a JSON file, reusing a pickle snapshot from a previous run.
+
+    The snapshot is keyed by the file's path and only used while the
+    file's mtime and size still match.
+    """
+    if cache_dir is None:
+        return load_json(path)
+
+    stat = path.stat()
+    key = hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()
+    snapshot = Path(cache_dir) / f"{key}.pkl"
+
+    try:
+        with open(snapshot, 'rb') as f:
+            mtime_ns, size, data = pickle.load(f)
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return data
+    except Exception:
+        pass  # Missing or corrupt snapshot; unpickling can raise almost anything
+
+    data = load_json(path)
+
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stat.st_mtime_ns, stat.st_size, data), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot)
+    except OSError:
+        pass  # The cache is best effort
+
+    return data
 
 
 class UniverseMCP:
@@ -17,40 +82,109 @@ class UniverseMCP:
     Use this in your application to access MCP server data.
     """
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", cache_dir: Optional[Path] = CACHE_DIR):
         """
         Initialize with path to Universe MCP repository.
 
         Args:
             repo_path: Path to universe_mcp repository
+            cache_dir: Where parsed index snapshots are kept (None, the default
+                unless UNIVERSE_MCP_CACHE_DIR is set, disables caching)
         """
         self.repo_path = Path(repo_path)
         self.index_dir = self.repo_path / "indexes"
         self.data_dir = self.repo_path / "data"
+        self.cache_dir = cache_dir
 
         # Load indexes
         self._load_indexes()
 
     def _load_indexes(self):
         """Load all index files"""
-        with open(self.index_dir / "all-servers.json") as f:
-            self.all_servers = json.load(f)
+        def load(filename):
+            return load_json_cached(self.index_dir / filename, self.cache_dir)
 
-        with open(self.index_dir / "statistics.json") as f:
-            self.stats = json.load(f)
+        self.all_servers = load("all-servers.json")
+        self.stats = load("statistics.json")
 
         try:
-            with open(self.index_dir / "servers-by-classification.json") as f:
-                self.by_classification = json.load(f)
+            self.by_classification = load("servers-by-classification.json")
         except FileNotFoundError:
             self.by_classification = {}
 
         try:
-            with open(self.index_dir / "servers-by-provider.json") as f:
-                self.by_provider = json.load(f)
+            self.by_provider = load("servers-by-provider.json")
         except FileNotFoundError:
             self.by_provider = {}
 
+        self._build_search_index()
+
+        # Memoize query results as server positions so repeated queries are
+        # O(1); recreated here so a reload never serves stale results
+        self._cached_search = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(self._search_positions)
+        self._cached_recommend = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(self._recommend_positions)
+
+    def _build_search_index(self):
+        """Join the lowercased server texts into one buffer per query type"""
+        self._server_by_id = {s['id']: s for s in self.all_servers['servers']}
+        search_texts = []
+        recommend_texts = []
+
+        for server in self.all_servers['servers']:
+            name = (server.get('name') or '').lower()
+            description = (server.get('description') or '').lower()
+
+            # search() matches within name, description or provider, so the
+            # fields are kept apart to stop a match spanning two of them
+            search_texts.append('\x01'.join([
+                name,
+                description,
+                (server.get('provider') or '').lower()
+            ]).encode('utf-8'))
+
+            # recommend_servers() matches anywhere in one space-joined text
+            recommend_texts.append(' '.join([
+                name,
+                description,
+                ' '.join(server.get('categories') or []).lower()
+            ]).encode('utf-8'))
+
+        self._search_blob, self._search_starts = self._join_texts(search_texts)
+        self._recommend_blob, self._recommend_starts = self._join_texts(recommend_texts)
+
+    @staticmethod
+    def _join_texts(texts: List[bytes]) -> Tuple[bytes, List[int]]:
+        """
+        Join per-server texts with NUL separators.
+
+        Substring searches run one bytes.find over all servers at once; the
+        returned start offsets map a match back to its server.
+        """
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return b'\0'.join(texts), starts
+
+    @staticmethod
+    def _find_positions(blob: bytes, starts: List[int], needle: str,
+                        limit: Optional[int] = None) -> List[int]:
+        """Positions of the servers whose text contains needle, in order"""
+        needle = needle.encode('utf-8')
+        positions = []
+        pos = blob.find(needle)
+        while pos >= 0 and (limit is None or len(positions) < limit):
+            i = bisect.bisect_right(starts, pos) - 1
+            positions.append(i)
+
+            # Continue after this server so each one matches at most once
+            if i + 1 == len(starts):
+                break
+            pos = blob.find(needle, starts[i + 1])
+
+        return positions
+
     def search(self, query: str, max_results: int = 10) -> List[Dict]:
         """
         Search for servers matching query.
@@ -62,27 +196,26 @@ class UniverseMCP:
         Returns:
             List of matching servers
         """
-        query_lower = query.lower()
-        results = []
-
-        for server in self.all_servers['servers']:
-            if (query_lower in server.get('name', '').lower() or
-                query_lower in server.get('description', '').lower() or
-                query_lower in server.get('provider', '').lower()):
-                results.append(server)
+        servers = self.all_servers['servers']
+        return [servers[i] for i in self._cached_search(query.lower(), max_results)]
 
-                if len(results) >= max_results:
-                    break
+    def _search_positions(self, query_lower: str, max_results: int) -> Tuple[int, ...]:
+        """Find the positions of servers matching an already lowercased query"""
+        # The first match is always returned, even for max_results < 1
+        return tuple(self._find_positions(
+            self._search_blob, self._search_starts, query_lower, max(max_results, 1)))
 
-        return results
+    def _resolve(self, server_ids: List[str]) -> List[Dict]:
+        """Map server IDs from a grouped index back to server records"""
+        return [self._server_by_id[sid] for sid in server_ids if sid in self._server_by_id]
 
     def get_official_servers(self) -> List[Dict]:
         """Get all official MCP servers"""
-        return self.by_classification.get('classifications', {}).get('official', [])
+        return self._resolve(self.by_classification.get('classifications', {}).get('official', []))
 
     def get_by_provider(self, provider: str) -> List[Dict]:
         """Get all servers by specific provider"""
-        return self.by_provider.get('providers', {}).get(provider, [])
+        return self._resolve(self.by_provider.get('providers', {}).get(provider, []))
 
     def get_statistics(self) -> Dict:
         """Get ecosystem statistics"""
@@ -98,28 +231,25 @@ class UniverseMCP:
         Returns:
             List of recommended servers
         """
-        # Simple keyword matching (can be enhanced with ML)
-        keywords = task.lower().split()
-        results = []
+        servers = self.all_servers['servers']
+        return [servers[i] for i in self._cached_recommend(task.lower())]
 
-        for server in self.all_servers['servers']:
-            score = 0
-            server_text = (
-                server.get('name', '') + ' ' +
-                server.get('description', '') + ' ' +
-                ' '.join(server.get('categories', []))
-            ).lower()
-
-            for keyword in keywords:
-                if keyword in server_text:
-                    score += 1
-
-            if score > 0:
-                results.append((score, server))
-
-        # Sort by score and return top results
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [server for score, server in results[:5]]
+    def _recommend_positions(self, task_lower: str) -> Tuple[int, ...]:
+        """Rank server positions for an already lowercased task description"""
+        # Simple keyword matching (can be enhanced with ML)
+        scores = Counter()
+
+        # Servers without a keyword are never visited, as bytes.find jumps
+        # straight between matches; a repeated keyword is scanned once and
+        # counted as often as it appears in the task
+        for keyword, weight in Counter(task_lower.split()).items():
+            positions = self._find_positions(
+                self._recommend_blob, self._recommend_starts, keyword)
+            scores.update(positions * weight)
+
+        # Keep only the top 5 scores; ties go to the earlier server
+        top = heapq.nlargest(5, scores.items(), key=lambda item: (item[1], -item[0]))
+        return tuple(i for i, score in top)
 
 
 # Example usage
@@ -9,30 +9,60 @@ the Universe MCP database.
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
 # Path to indexes
 INDEX_DIR = Path(__file__).parent.parent / "indexes"
 
 
+def load_index(filename: str):
+    """Parse an index file, using orjson when available"""
+    if orjson is not None:
+        with open(INDEX_DIR / filename, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(INDEX_DIR / filename, encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_servers():
     """Load all servers from index"""
-    with open(INDEX_DIR / "all-servers.json") as f:
-        data = json.load(f)
-    return data['servers']
+    return load_index("all-servers.json")['servers']
+
+
+def load_indexes() -> dict:
+    """Load every index the examples use, once"""
+    servers = load_servers()
+    try:
+        by_category = load_index("servers-by-category.json")
+    except FileNotFoundError:
+        by_category = None  # Only generated once servers have categories
+
+    return {
+        'servers': servers,
+        'servers_by_id': {s['id']: s for s in servers},
+        'by_classification': load_index("servers-by-classification.json"),
+        'statistics': load_index("statistics.json"),
+        'by_category': by_category
+    }
 
 
-def example_1_keyword_search():
+def example_1_keyword_search(indexes: dict):
     """Example 1: Search by keyword"""
     print("=" * 60)
     print("EXAMPLE 1: Keyword Search")
     print("=" * 60)
 
-    servers = load_servers()
+    servers = indexes['servers']
     keyword = "database"
+    keyword_lower = keyword.lower()
 
     results = [
         s for s in servers
-        if keyword.lower() in s.get('description', '').lower()
-        or keyword.lower() in s.get('name', '').lower()
+        if keyword_lower in (s.get('description') or '').lower()
+        or keyword_lower in (s.get('name') or '').lower()
     ]
 
     print(f"Found {len(results)} servers related to '{keyword}':\n")
@@ -42,30 +72,30 @@ def example_1_keyword_search():
         print()
 
 
-def example_2_official_servers():
+def example_2_official_servers(indexes: dict):
     """Example 2: Find all official servers"""
     print("=" * 60)
     print("EXAMPLE 2: Official Servers")
     print("=" * 60)
 
-    with open(INDEX_DIR / "servers-by-classification.json") as f:
-        data = json.load(f)
+    data = indexes['by_classification']
+    servers_by_id = indexes['servers_by_id']
 
-    official = data['classifications']['official']
+    # Grouped indexes list server IDs; look the records up in all-servers
+    official = [servers_by_id[sid] for sid in data['classifications']['official']]
 
     print(f"Found {len(official)} official servers:\n")
     for server in official[:10]:  # Show first 10
         print(f"- {server['name']} by {server.get('provider', 'Unknown')}")
 
 
-def example_3_top_providers():
+def example_3_top_providers(indexes: dict):
     """Example 3: Get top providers"""
     print("=" * 60)
     print("EXAMPLE 3: Top Providers")
     print("=" * 60)
 
-    with open(INDEX_DIR / "statistics.json") as f:
-        stats = json.load(f)
+    stats = indexes['statistics']
 
     top_providers = stats['servers']['top_providers']
 
@@ -74,14 +104,16 @@ def example_3_top_providers():
         print(f"{i}. {provider}: {count} servers")
 
 
-def example_4_by_category():
+def example_4_by_category(indexes: dict):
     """Example 4: Find servers by category"""
     print("=" * 60)
     print("EXAMPLE 4: Search by Category")
     print("=" * 60)
 
-    with open(INDEX_DIR / "servers-by-category.json") as f:
-        data = json.load(f)
+    data = indexes['by_category']
+    if data is None:
+        print("No category index yet (no server has categories)")
+        return
 
     categories = data['categories']
 
@@ -90,36 +122,37 @@ def example_4_by_category():
     # Show a specific category if exists
     if categories:
         category_name = list(categories.keys())[0]
-        servers = categories[category_name]
-        print(f"Servers in '{category_name}' ({len(servers)}):")
-        for server in servers[:5]:
-            print(f"- {server['name']}")
+        servers_by_id = indexes['servers_by_id']
+        server_ids = categories[category_name]
+        print(f"Servers in '{category_name}' ({len(server_ids)}):")
+        for server_id in server_ids[:5]:
+            print(f"- {servers_by_id[server_id]['name']}")
 
 
-def example_5_custom_filter():
+def example_5_custom_filter(indexes: dict):
     """Example 5: Custom filtering"""
     print("=" * 60)
     print("EXAMPLE 5: Custom Filter (Community + High Activity)")
     print("=" * 60)
 
-    servers = load_servers()
+    servers = indexes['servers']
 
     # Find community servers with high weekly metrics
     results = [
         s for s in servers
         if s.get('classification') == 'community'
-        and s.get('weekly_metric', {}).get('value', 0) > 100
+        and (s.get('weekly_metric') or {}).get('value', 0) > 100
     ]
 
     # Sort by metric
     results.sort(
-        key=lambda s: s.get('weekly_metric', {}).get('value', 0),
+        key=lambda s: (s.get('weekly_metric') or {}).get('value', 0),
         reverse=True
     )
 
     print(f"Found {len(results)} popular community servers:\n")
     for server in results[:10]:
-        metric = server.get('weekly_metric', {})
+        metric = server.get('weekly_metric') or {}
         print(f"- {server['name']}")
         print(f"  {metric.get('type', 'metric')}: {metric.get('value', 0):,}")
         print()
@@ -135,14 +168,18 @@ def main():
         example_5_custom_filter,
     ]
 
+    # Parse the index files once and share them across all examples
+    try:
+        indexes = load_indexes()
+    except FileNotFoundError:
+        print("❌ Index files not found. Run the indexer first:")
+        print("   python scripts/indexers/generate_indexes.py")
+        return
+
     for example in examples:
         try:
-            example()
+            example(indexes)
             print("\n")
-        except FileNotFoundError:
-            print("❌ Index files not found. Run the indexer first:")
-            print("   python scripts/indexers/generate_indexes.py")
-            break
         except Exception as e:
             print(f"❌ Error in {example.__name__}: {e}")
             print()
@@ -4,17 +4,69 @@ Universe MCP - Index Generator
 Generates search indexes and statistics
 """
 
+import heapq
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from collections import defaultdict, Counter
+from typing import Dict, List, Optional
+from collections import defaultdict
+from operator import itemgetter
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 INDEX_DIR = PROJECT_ROOT / "indexes"
 
+# Data files are small and I/O bound, so read them concurrently
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+SAVE_WORKERS = 4
+
+
+def load_json(path: Path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_json_files(root: Path, recursive: bool = False):
+    """Yield the paths of JSON files under root, walking it with os.scandir"""
+    pending = [os.fspath(root)]
+    while pending:
+        subdirs = []
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    yield entry.path
+                elif recursive and entry.is_dir():
+                    subdirs.append(entry.path)
+        # Visit subdirectories depth-first in the order they were listed
+        pending.extend(reversed(subdirs))
+
+
+def try_load_json(path: Path) -> Optional[Dict]:
+    """Parse a JSON file, reporting and skipping unreadable files"""
+    try:
+        return load_json(path)
+    except Exception as e:
+        print(f"⚠️  Error loading {path}: {e}")
+        return None
+
+
+def load_json_files(paths) -> List[Dict]:
+    """Parse many JSON files concurrently, preserving their order"""
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        return [data for data in executor.map(try_load_json, paths) if data is not None]
+
 
 class IndexGenerator:
     """Generates indexes for MCP data"""
@@ -26,107 +78,103 @@ class IndexGenerator:
 
     def load_all_servers(self) -> List[Dict]:
         """Load all server JSON files"""
-        servers = []
         server_dir = DATA_DIR / "servers"
-        if server_dir.exists():
-            for json_file in server_dir.glob("**/*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        servers.append(json.load(f))
-                except Exception as e:
-                    print(f"⚠️  Error loading {json_file}: {e}")
-        return servers
+        if not server_dir.exists():
+            return []
+        return load_json_files(list(iter_json_files(server_dir, recursive=True)))
 
     def load_all_clients(self) -> List[Dict]:
         """Load all client JSON files"""
-        clients = []
         client_dir = DATA_DIR / "clients"
-        if client_dir.exists():
-            for json_file in client_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        clients.append(json.load(f))
-                except Exception as e:
-                    print(f"⚠️  Error loading {json_file}: {e}")
-        return clients
+        if not client_dir.exists():
+            return []
+        return load_json_files(list(iter_json_files(client_dir)))
 
     def load_all_usecases(self) -> List[Dict]:
         """Load all use case JSON files"""
-        usecases = []
         usecase_dir = DATA_DIR / "use-cases"
-        if usecase_dir.exists():
-            for json_file in usecase_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        usecases.append(json.load(f))
-                except Exception as e:
-                    print(f"⚠️  Error loading {json_file}: {e}")
-        return usecases
-
-    def generate_server_indexes(self) -> Dict:
-        """Generate server-specific indexes"""
+        if not usecase_dir.exists():
+            return []
+        return load_json_files(list(iter_json_files(usecase_dir)))
+
+    def generate_server_indexes(self, generated_at: Optional[str] = None) -> Dict:
+        """
+        Generate server-specific indexes and their counts in a single pass.
+
+        Only all-servers.json embeds the full server records; the grouped
+        indexes list server IDs that refer back into it.
+        """
         # All servers index
         all_servers = {
             'total': len(self.servers),
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'servers': self.servers
         }
 
-        # By classification
         by_classification = defaultdict(list)
+        by_provider = defaultdict(list)
+        by_category = defaultdict(list)
+        with_description = 0
+        with_metrics = 0
+
         for server in self.servers:
+            # By classification (a null classification is grouped under "")
             classification = server.get('classification', 'community')
-            by_classification[classification].append(server)
+            if classification is None:
+                classification = ''
+            by_classification[classification].append(server['id'])
 
-        # By provider
-        by_provider = defaultdict(list)
-        for server in self.servers:
-            provider = server.get('provider', 'Unknown')
-            if provider:
-                by_provider[provider].append(server)
+            # By provider (servers without a provider are left out)
+            if (provider := server.get('provider')):
+                by_provider[provider].append(server['id'])
 
-        # By category
-        by_category = defaultdict(list)
-        for server in self.servers:
+            # By category
             for category in server.get('categories', []):
-                by_category[category].append(server)
+                by_category[category].append(server['id'])
+
+            if server.get('description'):
+                with_description += 1
+            if server.get('weekly_metric'):
+                with_metrics += 1
 
         return {
             'all': all_servers,
             'by_classification': dict(by_classification),
             'by_provider': dict(by_provider),
-            'by_category': dict(by_category)
+            'by_category': dict(by_category),
+            'counts': {
+                'classifications': {k: len(v) for k, v in by_classification.items()},
+                'providers': {k: len(v) for k, v in by_provider.items()},
+                'categories': {k: len(v) for k, v in by_category.items()},
+                'with_description': with_description,
+                'with_metrics': with_metrics
+            }
         }
 
-    def generate_statistics(self) -> Dict:
+    def generate_statistics(self, server_indexes: Optional[Dict] = None,
+                            generated_at: Optional[str] = None) -> Dict:
         """Generate statistics about the data"""
-        # Server stats
-        server_classifications = Counter(
-            s.get('classification', 'community') for s in self.servers
-        )
-        server_providers = Counter(
-            s.get('provider', 'Unknown') for s in self.servers if s.get('provider')
-        )
-
-        # Extract all categories
-        all_categories = []
-        for server in self.servers:
-            all_categories.extend(server.get('categories', []))
-        category_counts = Counter(all_categories)
+        # Server stats come from the counts gathered while grouping
+        if server_indexes is None:
+            server_indexes = self.generate_server_indexes(generated_at)
+        counts = server_indexes['counts']
+        server_classifications = counts['classifications']
+        server_providers = counts['providers']
+        category_counts = counts['categories']
 
         stats = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'totals': {
                 'servers': len(self.servers),
                 'clients': len(self.clients),
                 'use_cases': len(self.usecases)
             },
             'servers': {
-                'by_classification': dict(server_classifications),
-                'top_providers': dict(server_providers.most_common(20)),
-                'top_categories': dict(category_counts.most_common(20)),
-                'with_description': sum(1 for s in self.servers if s.get('description')),
-                'with_metrics': sum(1 for s in self.servers if s.get('weekly_metric'))
+                'by_classification': server_classifications,
+                'top_providers': dict(heapq.nlargest(20, server_providers.items(), key=itemgetter(1))),
+                'top_categories': dict(heapq.nlargest(20, category_counts.items(), key=itemgetter(1))),
+                'with_description': counts['with_description'],
+                'with_metrics': counts['with_metrics']
             },
             'clients': {
                 'total': len(self.clients)
@@ -138,12 +186,27 @@ class IndexGenerator:
 
         return stats
 
-    def save_index(self, filename: str, data: Dict):
-        """Save an index file"""
+    def save_index(self, filename: str, data: Dict, pretty: bool = False):
+        """Save an index file (compact unless pretty is requested)"""
         INDEX_DIR.mkdir(parents=True, exist_ok=True)
         file_path = INDEX_DIR / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path = file_path.with_suffix('.json.tmp')
+
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
+        # Replace atomically so readers never see a partially written index
+        os.replace(tmp_path, file_path)
         print(f"  ✅ Generated {filename}")
 
     def run(self) -> Dict:
@@ -164,42 +227,53 @@ class IndexGenerator:
 
         # Generate indexes
         print("\n📇 Generating indexes...")
+        indexes = []
+
+        # Every index from one run shares the same timestamp
+        generated_at = datetime.now().isoformat()
 
         # Server indexes
-        server_indexes = self.generate_server_indexes()
-        self.save_index('all-servers.json', server_indexes['all'])
-        self.save_index('servers-by-classification.json', {
-            'generated_at': datetime.now().isoformat(),
+        server_indexes = self.generate_server_indexes(generated_at)
+        indexes.append(('all-servers.json', server_indexes['all']))
+        indexes.append(('servers-by-classification.json', {
+            'generated_at': generated_at,
             'classifications': server_indexes['by_classification']
-        })
-        self.save_index('servers-by-provider.json', {
-            'generated_at': datetime.now().isoformat(),
+        }))
+        indexes.append(('servers-by-provider.json', {
+            'generated_at': generated_at,
             'providers': server_indexes['by_provider']
-        })
+        }))
         if server_indexes['by_category']:
-            self.save_index('servers-by-category.json', {
-                'generated_at': datetime.now().isoformat(),
+            indexes.append(('servers-by-category.json', {
+                'generated_at': generated_at,
                 'categories': server_indexes['by_category']
-            })
+            }))
 
         # Client index
-        self.save_index('all-clients.json', {
+        indexes.append(('all-clients.json', {
             'total': len(self.clients),
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at,
             'clients': self.clients
-        })
+        }))
 
         # Use case index
-        self.save_index('all-usecases.json', {
+        indexes.append(('all-usecases.json', {
             'total': len(self.usecases),
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at,
             'use_cases': self.usecases
-        })
+        }))
 
         # Statistics
         print("\n📊 Generating statistics...")
-        stats = self.generate_statistics()
-        self.save_index('statistics.json', stats)
+        stats = self.generate_statistics(server_indexes, generated_at)
+
+        # Each index is independent, so serialize and write them concurrently
+        print("\n💾 Writing indexes...")
+        with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as executor:
+            futures = [executor.submit(self.save_index, filename, data) for filename, data in indexes]
+            futures.append(executor.submit(self.save_index, 'statistics.json', stats, pretty=True))
+            for future in futures:
+                future.result()
 
         # Summary
         print("\n" + "=" * 80)
@@ -4,57 +4,213 @@ Universe MCP - Server Detail Enrichment
 Visits individual server pages to extract complete metadata
 """
 
-import requests
+import asyncio
+import gc
+import aiohttp
 from bs4 import BeautifulSoup
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import re
 from urllib.parse import urljoin
 
+from json_io import load_json, save_json
+
 # Configuration
 BASE_URL = "https://www.pulsemcp.com"
 DELAY_BETWEEN_REQUESTS = 2.0  # Be more conservative for detail pages
+CONCURRENT_REQUESTS = 4  # Detail pages fetched in parallel, each slot paced by the delay
+REQUEST_TIMEOUT = 30  # seconds
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 60  # seconds an idle pooled connection is kept open
+REENRICH_AFTER_DAYS = 7  # Servers enriched more recently are skipped
+MAX_INSTALL_COMMAND_LENGTH = 200  # Longer code blocks are not install commands
+MAX_TAGS = 20
+# Detail fields copied into a server's metadata
+METADATA_FIELDS = (
+    'github_stars',
+    'npm_package',
+    'pypi_package',
+    'installation_commands',
+    'use_case',
+)
+NON_TAG_TEXT = {'Home', 'Servers', 'Back', 'Share', 'Copy'}  # Navigation text styled like tags
+LOAD_WORKERS = 16  # Threads reading server files before enrichment starts
 MAX_RETRIES = 4
 RETRY_DELAYS = [2, 4, 8, 16]
+MAX_RETRY_AFTER = RETRY_DELAYS[-1] * 4  # seconds; caps a server-requested Retry-After
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "servers"
+VALIDATORS_FILE = PROJECT_ROOT / "scripts" / "scrapers" / ".validators_details.json"
+ENRICHED_INDEX_FILE = PROJECT_ROOT / "scripts" / "scrapers" / ".enriched_details.json"
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
 }
 
+# Patterns used when extracting details, compiled once at import
+GITHUB_HREF_RE = re.compile(r'github\.com')
+STARS_RE = re.compile(r'([\d.]+[km]?)\s*stars?', re.I)
+NPM_HREF_RE = re.compile(r'npmjs\.com/package')
+NPM_PACKAGE_RE = re.compile(r'npmjs\.com/package/([^/?]+)')
+PYPI_HREF_RE = re.compile(r'pypi\.org/project')
+PYPI_PACKAGE_RE = re.compile(r'pypi\.org/project/([^/?]+)')
+USE_CASE_RE = re.compile(r'use case', re.I)
+INSTALL_COMMAND_RE = re.compile(r'npm install|pip install|npx|uvx', re.I)
+DESCRIPTION_CLASS_RE = re.compile(r'description|text-|leading', re.I)
+TAG_CLASS_RE = re.compile(r'tag|badge|label|category', re.I)
+
+# fetch_page result when the server answered 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def try_load_json(path: Path) -> Optional[Dict]:
+    """Parse a JSON file, returning None if it can't be read"""
+    try:
+        return load_json(path)
+    except (OSError, ValueError):
+        return None
+
 
 class ServerDetailEnricher:
     """Enriches server data by visiting individual pages"""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        self.session: Optional[aiohttp.ClientSession] = None  # Opened by enrich_all()
         self.enriched_count = 0
+        self.unchanged_count = 0
         self.failed_count = 0
-
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[BeautifulSoup]:
-        """Fetch a page with retry logic"""
+        self.validators = self.load_validators()
+        self.enriched_index = self.load_enriched_index()
+        self.preloaded: Dict[Path, Dict] = {}  # Filled by run(), consumed by enrich_server()
+        self.started_at = datetime.now()  # Reset by run(); one clock read per run
+        self.started_at_iso = self.started_at.isoformat()
+
+    def load_validators(self) -> Dict:
+        """Load ETag/Last-Modified values seen on previous runs, keyed by URL"""
+        validators = try_load_json(VALIDATORS_FILE)
+        return validators if isinstance(validators, dict) else {}  # Start over if unreadable
+
+    def save_validators(self):
+        """Save ETag/Last-Modified values for the next run"""
+        VALIDATORS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_json(VALIDATORS_FILE, dict(sorted(self.validators.items())))
+
+    def load_enriched_index(self) -> Dict:
+        """Load when each server file was last enriched, keyed by its path under DATA_DIR"""
+        index = try_load_json(ENRICHED_INDEX_FILE)
+        return index if isinstance(index, dict) else {}  # Start over if unreadable
+
+    def save_enriched_index(self):
+        """Save the enriched_at index for the next run"""
+        ENRICHED_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_json(ENRICHED_INDEX_FILE, dict(sorted(self.enriched_index.items())))
+
+    def record_enriched(self, server_file: Path, enriched_at: str, checked_at: Optional[str] = None):
+        """
+        Remember a server file's enriched_at along with its current mtime.
+
+        checked_at is when the server's page was last looked at, which is
+        later than enriched_at when a re-check found nothing new.
+        """
+        self.enriched_index[server_file.relative_to(DATA_DIR).as_posix()] = {
+            'enriched_at': enriched_at,
+            'checked_at': checked_at or enriched_at,
+            'mtime_ns': server_file.stat().st_mtime_ns,
+        }
+
+    def is_recently_enriched(self, server_file: Path) -> bool:
+        """
+        Check the enriched index without opening the server file.
+
+        Freshness goes by when the page was last checked. An entry only
+        counts while the file's mtime is unchanged, so a file rewritten by
+        the scrapers since then is always re-checked.
+        """
+        entry = self.enriched_index.get(server_file.relative_to(DATA_DIR).as_posix())
+        if not entry:
+            return False
+        try:
+            if server_file.stat().st_mtime_ns != entry['mtime_ns']:
+                return False
+            checked_at = entry.get('checked_at') or entry['enriched_at']
+            days_since = (self.started_at - datetime.fromisoformat(checked_at)).days
+        except (OSError, LookupError, TypeError, ValueError):
+            return False  # Missing file or malformed entry, check the server again
+        return days_since < REENRICH_AFTER_DAYS
+
+    def has_current_enrichment(self, server_file: Path, server_data: Dict) -> bool:
+        """
+        Check that the server file still holds what the last enrichment wrote.
+
+        Only then may its page be revalidated with a conditional GET; a file
+        the scrapers have rewritten since has lost its enrichment fields, and
+        a 304 for it would leave it empty.
+        """
+        if not server_data.get('enriched_at'):
+            return False
+        entry = self.enriched_index.get(server_file.relative_to(DATA_DIR).as_posix())
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.RequestException as e:
-            if retry_count < MAX_RETRIES:
+            return bool(entry) and server_file.stat().st_mtime_ns == entry['mtime_ns']
+        except (OSError, LookupError, TypeError):
+            return False
+
+    def record_validators(self, url: str, validators: Dict):
+        """Remember the ETag/Last-Modified of a page whose enrichment was saved"""
+        if any(validators.values()):
+            self.validators[url] = validators
+        else:
+            self.validators.pop(url, None)
+
+    async def fetch_page(self, url: str, conditional: bool = False):
+        """
+        Fetch a page with retry logic.
+
+        Returns the parsed page (or None) and the page's ETag/Last-Modified.
+        When conditional, the validators saved for the page are sent so an
+        unchanged page comes back as a bodiless 304, in which case
+        NOT_MODIFIED is returned instead of a page.
+        """
+        headers = {}
+        cached = self.validators.get(url) if conditional else None
+        if not isinstance(cached, dict):
+            cached = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        for retry_count in range(MAX_RETRIES + 1):
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return NOT_MODIFIED, cached
+                    response.raise_for_status()
+                    content = await response.read()
+                    validators = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                    }
+                return BeautifulSoup(content, 'lxml'), validators
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if retry_count == MAX_RETRIES:
+                    print(f"  ❌ Failed after {MAX_RETRIES} retries")
+                    return None, {}
                 delay = RETRY_DELAYS[retry_count]
+                # Wait at least as long as a rate-limited (429/503) response
+                # asks, up to MAX_RETRY_AFTER; values that don't parse are ignored
+                retry_after = (getattr(e, 'headers', None) or {}).get('Retry-After', '')
+                try:
+                    delay = max(delay, min(int(retry_after), MAX_RETRY_AFTER))
+                except ValueError:
+                    pass
                 print(f"  ⚠️  Error: {e}")
                 print(f"  🔄 Retrying in {delay}s...")
-                time.sleep(delay)
-                return self.fetch_page(url, retry_count + 1)
-            else:
-                print(f"  ❌ Failed after {MAX_RETRIES} retries")
-                return None
+                await asyncio.sleep(delay)
 
     def extract_detail_data(self, soup: BeautifulSoup, url: str) -> Dict:
         """Extract detailed information from server detail page"""
@@ -62,45 +218,45 @@ class ServerDetailEnricher:
 
         try:
             # Extract GitHub/Source URL - more specific search for GitHub icon link
-            github_link = soup.find('a', href=re.compile(r'github\.com'))
+            github_link = soup.find('a', href=GITHUB_HREF_RE)
             if github_link:
                 details['source_url'] = github_link.get('href')
 
                 # Try to extract GitHub stars from the link text
                 link_text = github_link.get_text(strip=True)
-                stars_match = re.search(r'([\d.]+[km]?)\s*stars?', link_text, re.I)
+                stars_match = STARS_RE.search(link_text)
                 if stars_match:
                     stars_str = stars_match.group(1).lower()
                     # Convert "5k" -> 5000, "72.7k" -> 72700, etc
-                    if 'k' in stars_str:
-                        details['github_stars'] = int(float(stars_str.replace('k', '')) * 1000)
-                    elif 'm' in stars_str:
-                        details['github_stars'] = int(float(stars_str.replace('m', '')) * 1000000)
-                    else:
-                        try:
+                    try:
+                        if 'k' in stars_str:
+                            details['github_stars'] = int(float(stars_str.replace('k', '')) * 1000)
+                        elif 'm' in stars_str:
+                            details['github_stars'] = int(float(stars_str.replace('m', '')) * 1000000)
+                        else:
                             details['github_stars'] = int(stars_str)
-                        except:
-                            pass
+                    except ValueError:
+                        pass  # Not a number after all, e.g. "1.2.3" or a lone "."
 
             # Extract NPM package name from npm links
-            npm_link = soup.find('a', href=re.compile(r'npmjs\.com/package'))
+            npm_link = soup.find('a', href=NPM_HREF_RE)
             if npm_link:
                 npm_href = npm_link.get('href', '')
-                package_match = re.search(r'npmjs\.com/package/([^/?]+)', npm_href)
+                package_match = NPM_PACKAGE_RE.search(npm_href)
                 if package_match:
                     details['npm_package'] = package_match.group(1)
 
             # Extract PyPI package name
-            pypi_link = soup.find('a', href=re.compile(r'pypi\.org/project'))
+            pypi_link = soup.find('a', href=PYPI_HREF_RE)
             if pypi_link:
                 pypi_href = pypi_link.get('href', '')
-                package_match = re.search(r'pypi\.org/project/([^/?]+)', pypi_href)
+                package_match = PYPI_PACKAGE_RE.search(pypi_href)
                 if package_match:
                     details['pypi_package'] = package_match.group(1)
 
             # Extract full description - look for main content paragraphs
             # Try multiple strategies to find the description
-            desc_elem = soup.find('p', class_=lambda x: x and any(cls in str(x).lower() for cls in ['description', 'text-', 'leading']))
+            desc_elem = soup.find('p', class_=DESCRIPTION_CLASS_RE)
             if desc_elem:
                 desc_text = desc_elem.get_text(strip=True)
                 if len(desc_text) > 50:  # Meaningful description
@@ -111,37 +267,32 @@ class ServerDetailEnricher:
             install_commands = []
             for code_elem in code_blocks:
                 code_text = code_elem.get_text(strip=True)
-                # Look for install commands
-                if any(keyword in code_text.lower() for keyword in ['npm install', 'pip install', 'npx', 'uvx']):
-                    if len(code_text) < 200:  # Reasonable command length
-                        install_commands.append(code_text)
+                # Look for install commands, skipping long blocks (whole
+                # config files or READMEs) before paying for the regex scan
+                if len(code_text) < MAX_INSTALL_COMMAND_LENGTH and INSTALL_COMMAND_RE.search(code_text):
+                    install_commands.append(code_text)
             if install_commands:
                 details['installation_commands'] = install_commands
 
             # Extract use cases or examples
-            use_case_elem = soup.find(['div', 'section'], string=re.compile(r'use case', re.I))
+            use_case_elem = soup.find(['div', 'section'], string=USE_CASE_RE)
             if use_case_elem:
                 use_case_text = use_case_elem.get_text(strip=True)[:500]
                 if use_case_text:
                     details['use_case'] = use_case_text
 
-            # Extract categories/tags - look for badge-like elements
-            tags = []
-            tag_elements = soup.find_all(['span', 'a', 'div'], class_=lambda x: x and any(cls in str(x).lower() for cls in ['tag', 'badge', 'label', 'category']))
-            for tag_elem in tag_elements:
+            # Extract categories/tags - look for badge-like elements, keeping
+            # the first spelling of each tag (case-insensitive) in page order
+            tags = {}
+            for tag_elem in soup.find_all(['span', 'a', 'div'], class_=TAG_CLASS_RE):
                 tag_text = tag_elem.get_text(strip=True)
                 # Filter out common non-tag text
-                if tag_text and len(tag_text) < 30 and tag_text not in ['Home', 'Servers', 'Back', 'Share', 'Copy']:
-                    tags.append(tag_text)
+                if tag_text and len(tag_text) < 30 and tag_text not in NON_TAG_TEXT:
+                    tags.setdefault(tag_text.lower(), tag_text)
+                    if len(tags) == MAX_TAGS:
+                        break
             if tags:
-                # Remove duplicates while preserving order
-                seen = set()
-                unique_tags = []
-                for tag in tags:
-                    if tag.lower() not in seen:
-                        seen.add(tag.lower())
-                        unique_tags.append(tag)
-                details['tags'] = unique_tags[:20]  # Limit to 20 tags
+                details['tags'] = list(tags.values())
 
         except Exception as e:
             print(f"  ⚠️  Error extracting details: {e}")
@@ -150,19 +301,21 @@ class ServerDetailEnricher:
 
         return details
 
-    def enrich_server(self, server_file: Path) -> bool:
+    async def enrich_server(self, server_file: Path) -> bool:
         """Enrich a single server with detail page data"""
         try:
-            # Load existing server data
-            with open(server_file, 'r', encoding='utf-8') as f:
-                server_data = json.load(f)
+            # Load existing server data, preferably from the preload pass
+            server_data = self.preloaded.pop(server_file, None)
+            if server_data is None:
+                server_data = load_json(server_file)
 
-            # Skip if already enriched recently (within 7 days)
+            # Skip if already enriched recently (within REENRICH_AFTER_DAYS)
             if server_data.get('enriched_at'):
                 enriched_date = datetime.fromisoformat(server_data['enriched_at'])
-                days_since = (datetime.now() - enriched_date).days
-                if days_since < 7:
+                days_since = (self.started_at - enriched_date).days
+                if days_since < REENRICH_AFTER_DAYS:
                     print(f"  ⏭️  Skipping (enriched {days_since} days ago)")
+                    self.record_enriched(server_file, server_data['enriched_at'])
                     return True
 
             server_url = server_data.get('url')
@@ -173,8 +326,18 @@ class ServerDetailEnricher:
             print(f"\n📄 Enriching: {server_data.get('name')}")
             print(f"   URL: {server_url}")
 
-            # Fetch detail page
-            soup = self.fetch_page(server_url)
+            # Fetch detail page, then hold this request slot for the delay
+            # so each slot paces its own requests to PulseMCP. Revalidate
+            # only if the file still holds the last enrichment
+            conditional = self.has_current_enrichment(server_file, server_data)
+            soup, validators = await self.fetch_page(server_url, conditional)
+            await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
+            if soup is NOT_MODIFIED:
+                # Page unchanged since the last enrichment, nothing to re-extract
+                print("  ♻️  Not modified")
+                await self.mark_unchanged(server_file, server_data)
+                self.unchanged_count += 1
+                return True
             if not soup:
                 self.failed_count += 1
                 return False
@@ -182,47 +345,54 @@ class ServerDetailEnricher:
             # Extract details
             details = self.extract_detail_data(soup, server_url)
 
-            # Merge with existing data (don't overwrite existing good data)
+            # Merge with existing data (don't overwrite existing good data),
+            # noting whether anything actually changed
+            changed = False
 
             # Update description if the enriched one is longer/better
             if details.get('description_full') and len(details['description_full']) > len(server_data.get('description', '')):
                 server_data['description'] = details['description_full']
+                changed = True
 
             # Always update source_url if found (it's the most important enrichment)
-            if details.get('source_url'):
+            if details.get('source_url') and details['source_url'] != server_data.get('source_url'):
                 server_data['source_url'] = details['source_url']
+                changed = True
 
             # Update tags (merge with existing)
             if details.get('tags'):
                 existing_tags = set(server_data.get('tags', []))
                 existing_tags.update(details['tags'])
-                server_data['tags'] = sorted(list(existing_tags))  # Sort for consistency
+                merged_tags = sorted(list(existing_tags))  # Sort for consistency
+                if merged_tags != server_data.get('tags'):
+                    server_data['tags'] = merged_tags
+                    changed = True
 
             # Update categories (merge with existing)
             if details.get('categories'):
                 existing_cats = set(server_data.get('categories', []))
                 existing_cats.update(details['categories'])
-                server_data['categories'] = sorted(list(existing_cats))  # Sort for consistency
-
-            # Add metadata
-            if 'metadata' not in server_data:
-                server_data['metadata'] = {}
+                merged_cats = sorted(list(existing_cats))  # Sort for consistency
+                if merged_cats != server_data.get('categories'):
+                    server_data['categories'] = merged_cats
+                    changed = True
 
             # Add new metadata fields
-            metadata_fields = [
-                'github_stars',
-                'npm_package',
-                'pypi_package',
-                'installation_commands',
-                'use_case'
-            ]
-
-            for key in metadata_fields:
-                if details.get(key):
-                    server_data['metadata'][key] = details[key]
+            metadata = server_data.setdefault('metadata', {})
+            for key in METADATA_FIELDS:
+                if details.get(key) and metadata.get(key) != details[key]:
+                    metadata[key] = details[key]
+                    changed = True
+
+            if not changed:
+                print("  ♻️  Nothing new")
+                await self.mark_unchanged(server_file, server_data)
+                self.record_validators(server_url, validators)
+                self.unchanged_count += 1
+                return True
 
             # Mark as enriched
-            server_data['enriched_at'] = datetime.now().isoformat()
+            server_data['enriched_at'] = self.started_at_iso
 
             # Count enrichments added
             enrichments_added = []
@@ -242,9 +412,9 @@ class ServerDetailEnricher:
             if enrichments_added:
                 print(f"  ✅ Added: {', '.join(enrichments_added)}")
 
-            # Save updated data
-            with open(server_file, 'w', encoding='utf-8') as f:
-                json.dump(server_data, f, indent=2, ensure_ascii=False)
+            # Save updated data; only then is the page's ETag worth keeping
+            await self.save_server(server_file, server_data)
+            self.record_validators(server_url, validators)
 
             self.enriched_count += 1
             return True
@@ -254,12 +424,74 @@ class ServerDetailEnricher:
             self.failed_count += 1
             return False
 
+    async def mark_unchanged(self, server_file: Path, server_data: Dict):
+        """
+        Record a re-enrichment that found nothing new.
+
+        A file never stamped with enriched_at is saved with one. Otherwise
+        the file is left untouched, so unchanged servers don't churn the data
+        files. The enriched index keeps the file's own enriched_at and notes
+        this run as checked_at, so the server is skipped for the next
+        REENRICH_AFTER_DAYS like a freshly enriched one.
+        """
+        if not server_data.get('enriched_at'):
+            server_data['enriched_at'] = self.started_at_iso
+            await self.save_server(server_file, server_data)
+        else:
+            self.record_enriched(server_file, server_data['enriched_at'], self.started_at_iso)
+
+    async def save_server(self, server_file: Path, server_data: Dict):
+        """Write a server file on a worker thread so other requests keep running"""
+        await asyncio.to_thread(save_json, server_file, server_data)
+        self.record_enriched(server_file, server_data['enriched_at'])
+
+    async def enrich_all(self, server_files: List[Path]):
+        """Enrich servers concurrently, at most CONCURRENT_REQUESTS at a time"""
+        semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+        total = len(server_files)
+
+        async def enrich_bounded(i: int, server_file: Path):
+            async with semaphore:
+                print(f"[{i}/{total}]", end=" ")
+                await self.enrich_server(server_file)
+            # A parsed page is a BeautifulSoup reference cycle that only the
+            # cyclic collector frees; reclaim it as soon as the server is done
+            gc.collect()
+
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        # Every request goes to PulseMCP, so keep one pooled connection per
+        # slot and cache its DNS lookup for minutes rather than 10s
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CONCURRENT_REQUESTS,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+            self.session = session
+            # Parsing allocates enough objects to trigger repeated automatic
+            # collections mid-page, so collect once per server instead
+            gc.disable()
+            try:
+                await asyncio.gather(*(
+                    enrich_bounded(i, server_file)
+                    for i, server_file in enumerate(server_files, 1)
+                ))
+            finally:
+                self.session = None
+                self.save_validators()
+                self.save_enriched_index()
+                gc.enable()
+
     def run(self, classification: Optional[str] = None, limit: Optional[int] = None):
         """Run enrichment on servers"""
         print("=" * 80)
         print("🔍 UNIVERSE MCP - Server Detail Enrichment")
         print("=" * 80)
 
+        # Freshness checks and enriched_at stamps all use the run's start time
+        self.started_at = datetime.now()
+        self.started_at_iso = self.started_at.isoformat()
+
         # Get all server files
         if classification:
             server_files = list((DATA_DIR / classification).glob("*.json"))
@@ -272,22 +504,32 @@ class ServerDetailEnricher:
             server_files = server_files[:limit]
 
         total = len(server_files)
+
+        # Drop servers the index says are fresh before opening any files
+        server_files = [f for f in server_files if not self.is_recently_enriched(f)]
+        skipped = total - len(server_files)
+
         print(f"\n📊 Found {total} servers to process")
-        print(f"⏱️  Estimated time: ~{total * (DELAY_BETWEEN_REQUESTS + 2):.0f}s")
+        if skipped:
+            print(f"⏭️  Skipping {skipped} servers enriched in the last {REENRICH_AFTER_DAYS} days")
+        print(f"⏱️  Estimated time: ~{len(server_files) * (DELAY_BETWEEN_REQUESTS + 2) / CONCURRENT_REQUESTS:.0f}s")
+        print(f"🔀 Concurrent requests: {CONCURRENT_REQUESTS}")
         print()
 
-        for i, server_file in enumerate(server_files, 1):
-            print(f"[{i}/{total}]", end=" ")
-            self.enrich_server(server_file)
+        # Read the remaining files in parallel; any that fail are re-read
+        # (and reported) by enrich_server
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+            for server_file, server_data in zip(server_files, pool.map(try_load_json, server_files)):
+                if server_data is not None:
+                    self.preloaded[server_file] = server_data
 
-            # Delay between requests
-            if i < total:
-                time.sleep(DELAY_BETWEEN_REQUESTS)
+        asyncio.run(self.enrich_all(server_files))
 
         print("\n" + "=" * 80)
         print("📊 ENRICHMENT SUMMARY")
         print("=" * 80)
         print(f"✅ Successfully enriched: {self.enriched_count}")
+        print(f"♻️  Unchanged: {self.unchanged_count}")
         print(f"❌ Failed: {self.failed_count}")
         print(f"📁 Total processed: {total}")
         print("=" * 80)
@@ -0,0 +1,39 @@
+"""
+Universe MCP - JSON Helpers
+Reading and writing of data files shared by the scrapers
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+
+def load_json(path: Path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path: Path, data):
+    """
+    Write JSON with 2-space indentation, using orjson when available.
+
+    The data goes to a temporary file that is then renamed over the target,
+    so an interrupted run never leaves a half-written file behind.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
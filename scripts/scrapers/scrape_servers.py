@@ -16,12 +16,15 @@ from urllib.parse import urljoin, urlparse
 import sys
 from tqdm import tqdm
 
+from json_io import save_json
+
 # Configuration
 BASE_URL = "https://www.pulsemcp.com"
 SERVERS_URL = f"{BASE_URL}/servers"
 DELAY_BETWEEN_REQUESTS = 1.5  # seconds
 MAX_RETRIES = 4
 RETRY_DELAYS = [2, 4, 8, 16]  # exponential backoff
+MAX_RETRY_AFTER = RETRY_DELAYS[-1] * 4  # seconds; caps a server-requested Retry-After
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -39,6 +42,13 @@ HEADERS = {
     'Upgrade-Insecure-Requests': '1'
 }
 
+# Patterns compiled once at import
+SERVER_CARD_HREF_RE = re.compile(r'^/servers/[^/]+$')
+METRIC_VALUE_RE = re.compile(r'([\d.]+)([km]?)')  # e.g. "439k", "1.2m", "123"
+TOTAL_SERVERS_RE = re.compile(r'of\s+([\d,]+)\s+servers', re.IGNORECASE)
+PAGE_LINK_RE = re.compile(r'\?page=\d+')
+PAGE_NUMBER_RE = re.compile(r'page=(\d+)')
+
 
 class ServerScraper:
     """Scraper for MCP servers from PulseMCP"""
@@ -71,22 +81,28 @@ class ServerScraper:
         with open(CHECKPOINT_FILE, 'w') as f:
             json.dump(self.checkpoint_data, f, indent=2)
 
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch a page with retry logic"""
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.RequestException as e:
-            if retry_count < MAX_RETRIES:
+        for retry_count in range(MAX_RETRIES + 1):
+            try:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                return BeautifulSoup(response.content, 'lxml')
+            except requests.RequestException as e:
+                if retry_count == MAX_RETRIES:
+                    print(f"  ❌ Failed to fetch {url} after {MAX_RETRIES} retries: {e}")
+                    return None
                 delay = RETRY_DELAYS[retry_count]
+                # Wait at least as long as a rate-limited (429/503) response
+                # asks, up to MAX_RETRY_AFTER; values that don't parse are ignored
+                retry_after = e.response.headers.get('Retry-After', '') if e.response is not None else ''
+                try:
+                    delay = max(delay, min(int(retry_after), MAX_RETRY_AFTER))
+                except ValueError:
+                    pass
                 print(f"  ⚠️  Error fetching {url}: {e}")
                 print(f"  🔄 Retrying in {delay}s... (attempt {retry_count + 1}/{MAX_RETRIES})")
                 time.sleep(delay)
-                return self.fetch_page(url, retry_count + 1)
-            else:
-                print(f"  ❌ Failed to fetch {url} after {MAX_RETRIES} retries: {e}")
-                return None
 
     def extract_server_data(self, card) -> Optional[Dict]:
         """Extract data from a server card element using CSS selectors"""
@@ -96,7 +112,7 @@ class ServerScraper:
             if not href or not href.startswith('/servers/'):
                 return None
 
-            server_id = href.split('/servers/')[-1]
+            server_id = href.removeprefix('/servers/')
             url = urljoin(BASE_URL, href)
 
             # Extract name (h3 tag with specific classes)
@@ -113,53 +129,53 @@ class ServerScraper:
             desc_elem = card.find('p', class_=lambda x: x and 'text-15' in x and 'leading-relaxed' in x)
             description = desc_elem.get_text(strip=True) if desc_elem else None
 
-            # Extract classification - look for "Classification" label
+            # Extract the labelled stats ("Classification", "Est Downloads" or
+            # "Est Visitors", "Release Date") in one pass over the card's divs,
+            # reading and lowercasing each label once for all three
             classification = None
-            classification_divs = card.find_all('div')
-            for div in classification_divs:
+            weekly_metric = None
+            release_date = None
+            metric_seen = False
+            release_date_seen = False
+            for div in card.find_all('div'):
                 label = div.find('p', class_=lambda x: x and 'text-12' in x and 'uppercase' in x)
-                if label and 'classification' in label.get_text().lower():
+                if not label:
+                    continue
+                label_text = label.get_text().lower()
+
+                if classification is None and 'classification' in label_text:
                     value_p = div.find('p', class_=lambda x: x and 'text-14' in x and 'capitalize' in x)
                     if value_p:
                         classification = value_p.get_text(strip=True).lower()
-                        break
 
-            # Extract weekly metric - look for "Est Downloads" or "Est Visitors" label
-            weekly_metric = None
-            for div in classification_divs:
-                label = div.find('p', class_=lambda x: x and 'text-12' in x and 'uppercase' in x)
-                if label:
-                    label_text = label.get_text().lower()
-                    if 'est downloads' in label_text or 'est visitors' in label_text:
-                        value_p = div.find('p', class_=lambda x: x and 'text-14' in x)
-                        if value_p:
-                            value_text = value_p.get_text(strip=True)
-                            # Parse number (e.g., "439k", "1.2m", "123")
-                            match = re.search(r'([\d.]+)([km]?)', value_text.lower())
-                            if match:
-                                number = float(match.group(1))
-                                multiplier = match.group(2)
-                                if multiplier == 'k':
-                                    number *= 1000
-                                elif multiplier == 'm':
-                                    number *= 1000000
-
-                                weekly_metric = {
-                                    'type': 'downloads' if 'downloads' in label_text else 'visitors',
-                                    'value': int(number)
-                                }
-                        break
-
-            # Extract release date - look for "Release Date" label
-            release_date = None
-            for div in classification_divs:
-                label = div.find('p', class_=lambda x: x and 'text-12' in x and 'uppercase' in x)
-                if label and 'release date' in label.get_text().lower():
+                if not metric_seen and ('est downloads' in label_text or 'est visitors' in label_text):
+                    metric_seen = True
                     value_p = div.find('p', class_=lambda x: x and 'text-14' in x)
                     if value_p:
-                        date_text = value_p.get_text(strip=True)
-                        # Try to parse date formats like "Mar 22, 2025" or "2025-03-22"
-                        release_date = date_text
+                        value_text = value_p.get_text(strip=True)
+                        # Parse number (e.g., "439k", "1.2m", "123")
+                        match = METRIC_VALUE_RE.search(value_text.lower())
+                        if match:
+                            number = float(match.group(1))
+                            multiplier = match.group(2)
+                            if multiplier == 'k':
+                                number *= 1000
+                            elif multiplier == 'm':
+                                number *= 1000000
+
+                            weekly_metric = {
+                                'type': 'downloads' if 'downloads' in label_text else 'visitors',
+                                'value': int(number)
+                            }
+
+                if not release_date_seen and 'release date' in label_text:
+                    release_date_seen = True
+                    value_p = div.find('p', class_=lambda x: x and 'text-14' in x)
+                    if value_p:
+                        # Kept as shown, e.g. "Mar 22, 2025" or "2025-03-22"
+                        release_date = value_p.get_text(strip=True)
+
+                if classification is not None and metric_seen and release_date_seen:
                     break
 
             # Build server object
@@ -200,8 +216,7 @@ class ServerScraper:
 
         # Save to file
         file_path = server_dir / f"{server_data['id']}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(server_data, f, indent=2, ensure_ascii=False)
+        save_json(file_path, server_data)
 
     def scrape_page(self, page: int) -> List[Dict]:
         """Scrape a single page of servers"""
@@ -213,7 +228,7 @@ class ServerScraper:
             return []
 
         # Find all server cards (links to /servers/...)
-        server_cards = soup.find_all('a', href=re.compile(r'^/servers/[^/]+$'))
+        server_cards = soup.find_all('a', href=SERVER_CARD_HREF_RE)
 
         servers = []
         for card in server_cards:
@@ -237,7 +252,7 @@ class ServerScraper:
         # Look for pagination info or last page number
         # Try to find text like "1 - 42 of 6488 servers"
         text_content = soup.get_text()
-        match = re.search(r'of\s+([\d,]+)\s+servers', text_content, re.IGNORECASE)
+        match = TOTAL_SERVERS_RE.search(text_content)
         if match:
             total_servers = int(match.group(1).replace(',', ''))
             servers_per_page = 42  # Known from analysis
@@ -247,11 +262,11 @@ class ServerScraper:
             return total_pages
 
         # Fallback: look for last page link
-        page_links = soup.find_all('a', href=re.compile(r'\?page=\d+'))
+        page_links = soup.find_all('a', href=PAGE_LINK_RE)
         if page_links:
             page_numbers = []
             for link in page_links:
-                match = re.search(r'page=(\d+)', link.get('href', ''))
+                match = PAGE_NUMBER_RE.search(link.get('href', ''))
                 if match:
                     page_numbers.append(int(match.group(1)))
             if page_numbers:
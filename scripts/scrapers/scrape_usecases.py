@@ -15,12 +15,15 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 from tqdm import tqdm
 
+from json_io import save_json
+
 # Configuration
 BASE_URL = "https://www.pulsemcp.com"
 USECASES_URL = f"{BASE_URL}/use-cases"
 DELAY_BETWEEN_REQUESTS = 1.5
 MAX_RETRIES = 4
 RETRY_DELAYS = [2, 4, 8, 16]
+MAX_RETRY_AFTER = RETRY_DELAYS[-1] * 4  # seconds; caps a server-requested Retry-After
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -32,6 +35,11 @@ HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
 }
 
+# Patterns compiled once at import
+USECASE_CARD_HREF_RE = re.compile(r'^/use-cases/[^/]+$')
+PAGE_LINK_RE = re.compile(r'\?page=\d+')
+PAGE_NUMBER_RE = re.compile(r'page=(\d+)')
+
 
 class UseCaseScraper:
     """Scraper for MCP use cases from PulseMCP"""
@@ -64,22 +72,28 @@ class UseCaseScraper:
         with open(CHECKPOINT_FILE, 'w') as f:
             json.dump(self.checkpoint_data, f, indent=2)
 
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch a page with retry logic"""
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.RequestException as e:
-            if retry_count < MAX_RETRIES:
+        for retry_count in range(MAX_RETRIES + 1):
+            try:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                return BeautifulSoup(response.content, 'lxml')
+            except requests.RequestException as e:
+                if retry_count == MAX_RETRIES:
+                    print(f"  ❌ Failed after {MAX_RETRIES} retries: {e}")
+                    return None
                 delay = RETRY_DELAYS[retry_count]
+                # Wait at least as long as a rate-limited (429/503) response
+                # asks, up to MAX_RETRY_AFTER; values that don't parse are ignored
+                retry_after = e.response.headers.get('Retry-After', '') if e.response is not None else ''
+                try:
+                    delay = max(delay, min(int(retry_after), MAX_RETRY_AFTER))
+                except ValueError:
+                    pass
                 print(f"  ⚠️  Error: {e}")
                 print(f"  🔄 Retrying in {delay}s... (attempt {retry_count + 1}/{MAX_RETRIES})")
                 time.sleep(delay)
-                return self.fetch_page(url, retry_count + 1)
-            else:
-                print(f"  ❌ Failed after {MAX_RETRIES} retries: {e}")
-                return None
 
     def extract_usecase_data(self, card) -> Optional[Dict]:
         """Extract data from a use case card element"""
@@ -88,7 +102,7 @@ class UseCaseScraper:
             if not href or not href.startswith('/use-cases/'):
                 return None
 
-            usecase_id = href.split('/use-cases/')[-1]
+            usecase_id = href.removeprefix('/use-cases/')
             url = urljoin(BASE_URL, href)
 
             # Extract title
@@ -126,8 +140,7 @@ class UseCaseScraper:
         """Save use case data to JSON file"""
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         file_path = DATA_DIR / f"{usecase_data['id']}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(usecase_data, f, indent=2, ensure_ascii=False)
+        save_json(file_path, usecase_data)
 
     def scrape_page(self, page: int) -> List[Dict]:
         """Scrape a single page of use cases"""
@@ -138,7 +151,7 @@ class UseCaseScraper:
         if not soup:
             return []
 
-        usecase_cards = soup.find_all('a', href=re.compile(r'^/use-cases/[^/]+$'))
+        usecase_cards = soup.find_all('a', href=USECASE_CARD_HREF_RE)
 
         usecases = []
         for card in usecase_cards:
@@ -158,11 +171,11 @@ class UseCaseScraper:
         if not soup:
             return 1
 
-        page_links = soup.find_all('a', href=re.compile(r'\?page=\d+'))
+        page_links = soup.find_all('a', href=PAGE_LINK_RE)
         if page_links:
             page_numbers = []
             for link in page_links:
-                match = re.search(r'page=(\d+)', link.get('href', ''))
+                match = PAGE_NUMBER_RE.search(link.get('href', ''))
                 if match:
                     page_numbers.append(int(match.group(1)))
             if page_numbers:
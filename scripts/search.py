@@ -19,6 +19,7 @@ class MCPSearch:
 
     def __init__(self):
         self.servers = []
+        self.lowered = []
         self.load_data()
 
     def load_data(self):
@@ -33,6 +34,18 @@ class MCPSearch:
             data = json.load(f)
             self.servers = data.get('servers', [])
 
+        # Lowercase searchable fields once instead of on every query
+        self.lowered = [
+            {
+                'name': (s.get('name') or '').lower(),
+                'description': (s.get('description') or '').lower(),
+                'provider': (s.get('provider') or '').lower(),
+                'tags': ' '.join(s.get('tags') or []).lower(),
+                'categories': [cat.lower() for cat in s.get('categories') or []]
+            }
+            for s in self.servers
+        ]
+
         print(f"📚 Loaded {len(self.servers)} servers\n")
 
     def search_by_keyword(self, keyword: str) -> List[Dict]:
@@ -40,11 +53,11 @@ class MCPSearch:
         keyword_lower = keyword.lower()
         results = []
 
-        for server in self.servers:
-            if (keyword_lower in server.get('name', '').lower() or
-                keyword_lower in server.get('description', '').lower() or
-                keyword_lower in ' '.join(server.get('tags', [])).lower() or
-                keyword_lower in server.get('provider', '').lower()):
+        for server, lc in zip(self.servers, self.lowered):
+            if (keyword_lower in lc['name'] or
+                keyword_lower in lc['description'] or
+                keyword_lower in lc['tags'] or
+                keyword_lower in lc['provider']):
                 results.append(server)
 
         return results
@@ -56,14 +69,39 @@ class MCPSearch:
     def search_by_provider(self, provider: str) -> List[Dict]:
         """Search servers by provider"""
         provider_lower = provider.lower()
-        return [s for s in self.servers
-                if provider_lower in s.get('provider', '').lower()]
+        return [s for s, lc in zip(self.servers, self.lowered)
+                if provider_lower in lc['provider']]
 
     def search_by_category(self, category: str) -> List[Dict]:
         """Search servers by category"""
         category_lower = category.lower()
-        return [s for s in self.servers
-                if any(category_lower in cat.lower() for cat in s.get('categories', []))]
+        return [s for s, lc in zip(self.servers, self.lowered)
+                if any(category_lower in cat for cat in lc['categories'])]
+
+    def filter_servers(self, keyword: Optional[str] = None,
+                       classification: Optional[str] = None,
+                       provider: Optional[str] = None,
+                       category: Optional[str] = None) -> List[Dict]:
+        """Apply all given filters in a single pass over the servers"""
+        keyword_lower = keyword.lower() if keyword else None
+        provider_lower = provider.lower() if provider else None
+        category_lower = category.lower() if category else None
+        results = []
+
+        for server, lc in zip(self.servers, self.lowered):
+            if classification and server.get('classification') != classification:
+                continue
+            if provider_lower and provider_lower not in lc['provider']:
+                continue
+            if category_lower and not any(category_lower in cat for cat in lc['categories']):
+                continue
+            if keyword_lower and not (keyword_lower in lc['name'] or
+                                      keyword_lower in lc['description'] or
+                                      keyword_lower in lc['tags']):
+                continue
+            results.append(server)
+
+        return results
 
     def display_results(self, results: List[Dict], limit: Optional[int] = None):
         """Display search results"""
@@ -144,27 +182,12 @@ Examples:
     search = MCPSearch()
 
     # Perform search based on arguments
-    results = search.servers  # Start with all servers
-
-    if args.classification:
-        results = [s for s in results if s.get('classification') == args.classification]
-
-    if args.provider:
-        provider_lower = args.provider.lower()
-        results = [s for s in results
-                  if provider_lower in s.get('provider', '').lower()]
-
-    if args.category:
-        category_lower = args.category.lower()
-        results = [s for s in results
-                  if any(category_lower in cat.lower() for cat in s.get('categories', []))]
-
-    if args.keyword:
-        keyword_lower = args.keyword.lower()
-        results = [s for s in results
-                  if (keyword_lower in s.get('name', '').lower() or
-                      keyword_lower in s.get('description', '').lower() or
-                      keyword_lower in ' '.join(s.get('tags', [])).lower())]
+    results = search.filter_servers(
+        keyword=args.keyword,
+        classification=args.classification,
+        provider=args.provider,
+        category=args.category
+    )
 
     # Output results
     if args.json: